@@ -13,6 +13,7 @@ from models.schemas import (
 )
 from services.profile_service import ProfileService
 from utils.database import get_graphiti
+from utils.profile_cache import profile_cache_key, get_cached_results, cache_results
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,15 +42,20 @@ async def search_profile(
     This endpoint performs hybrid search (semantic + BM25) to find
     relevant insights about the user's psychological profile.
     """
-    logger.info(f"Profile search for user {query_data.user_id}: '{query_data.query[:50]}...'")
+    logger.info("Profile search for user %s: '%s...'", query_data.user_id, query_data.query[:50])
     try:
-        results = await profile_service.search_profile(
-            query=query_data.query,
-        )
+        cache_key = profile_cache_key(query_data.user_id, query_data.query)
+        results = get_cached_results(cache_key)
+        if results is None:
+            results = await profile_service.search_profile(
+                query=query_data.query,
+                user_id=query_data.user_id,
+            )
+            cache_results(cache_key, results)
         
-        logger.info(f"Profile search completed: {len(results)} results found for user {query_data.user_id}")
+        logger.info("Profile search completed: %d results found for user %s", len(results), query_data.user_id)
         
-        return ProfileQueryResponse(
+        return ProfileQueryResponse.model_construct(
             query=query_data.query,
             results=results,
             count=len(results),
@@ -57,7 +63,7 @@ async def search_profile(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Profile search failed for user {query_data.user_id}: {e}", exc_info=True)
+        logger.error("Profile search failed for user %s: %s", query_data.user_id, e, exc_info=True)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to search profile: {str(e)}"
@@ -80,20 +86,30 @@ async def search_with_center_node(
     graph distance, providing more contextually relevant results.
     """
     logger.info(
-        f"Center node search for user {query_data.user_id}: "
-        f"'{query_data.query[:50]}...' (Center: {query_data.center_node_uuid[:8]}...)"
+        "Center node search for user %s: '%s...' (Center: %s...)",
+        query_data.user_id, query_data.query[:50], query_data.center_node_uuid[:8],
     )
     try:
-        results = await profile_service.search_profile(
-            query=query_data.query,
-            center_node_uuid=query_data.center_node_uuid,
+        cache_key = profile_cache_key(
+            query_data.user_id,
+            query_data.query,
+            query_data.center_node_uuid,
         )
+        results = get_cached_results(cache_key)
+        if results is None:
+            results = await profile_service.search_profile(
+                query=query_data.query,
+                user_id=query_data.user_id,
+                center_node_uuid=query_data.center_node_uuid,
+            )
+            cache_results(cache_key, results)
         
         logger.info(
-            f"Center node search completed: {len(results)} results found for user {query_data.user_id}"
+            "Center node search completed: %d results found for user %s",
+            len(results), query_data.user_id,
         )
         
-        return ProfileQueryResponse(
+        return ProfileQueryResponse.model_construct(
             query=query_data.query,
             results=results,
             count=len(results),
@@ -102,7 +118,7 @@ async def search_with_center_node(
         raise
     except Exception as e:
         logger.error(
-            f"Center node search failed for user {query_data.user_id}: {e}",
+            "Center node search failed for user %s: %s", query_data.user_id, e,
             exc_info=True
         )
         raise HTTPException(
@@ -5,10 +5,17 @@ Therapy session management endpoints
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from graphiti_core import Graphiti
 
-from models.schemas import SessionCreate, SessionResponse, ErrorResponse
+from models.schemas import (
+    SessionCreate,
+    SessionResponse,
+    SessionBatchCreate,
+    SessionBatchResponse,
+    ErrorResponse,
+)
 from services.session_service import SessionService
 from services.user_service import UserService
 from utils.database import get_graphiti
+from utils.profile_cache import invalidate_user_profile
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -48,33 +55,10 @@ async def create_session(
     The session will be processed asynchronously to extract entities,
     relationships, and psychological patterns.
     """
-    logger.info(f"Adding session for user: {user_id} (Session #{session_data.session_number or 'auto'})")
+    logger.info("Adding session for user: %s (Session #%s)", user_id, session_data.session_number or 'auto')
     try:
-        # Get or create user
-        # Try to find existing user first
-        from graphiti_core.nodes import EntityNode
-        
-        find_user_query = """
-            MATCH (user:Entity {group_id: $group_id})
-            WHERE 'User' IN labels(user)
-            RETURN user.uuid AS uuid
-            LIMIT 1
-        """
-        
-        records, _, _ = await session_service.graphiti.driver.execute_query(
-            find_user_query,
-            group_id=user_id,
-        )
-        
-        if records:
-            user_uuid = records[0]['uuid']
-            user_node = await EntityNode.get_by_uuid(session_service.graphiti.driver, user_uuid)
-        else:
-            # Create new user with default name
-            user_node = await user_service.create_or_get_user(
-                user_name=f"User_{user_id}",
-                user_id=user_id,
-            )
+        # Get or create user (cached per user_id)
+        user_node = await user_service.get_or_create_user_node(user_id)
         
         # Add session
         episode_uuid, session_number = await session_service.add_session(
@@ -84,6 +68,7 @@ async def create_session(
             user_name=user_node.name,
             session_number=session_data.session_number,
         )
+        invalidate_user_profile(user_id)
         
         # Link session to user in background
         background_tasks.add_task(
@@ -93,11 +78,11 @@ async def create_session(
         )
         
         logger.info(
-            f"Session added successfully: User {user_id}, Session {session_number}, "
-            f"Episode UUID: {episode_uuid}"
+            "Session added successfully: User %s, Session %s, Episode UUID: %s",
+            user_id, session_number, episode_uuid,
         )
         
-        return SessionResponse(
+        return SessionResponse.model_construct(
             session_id=f"{user_id}_session_{session_number}",
             session_number=session_number,
             session_date=session_data.session_date,
@@ -107,9 +92,70 @@ async def create_session(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to add session for user {user_id}: {e}", exc_info=True)
+        logger.error("Failed to add session for user %s: %s", user_id, e, exc_info=True)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to add session: {str(e)}"
         )
 
+
+
+@router.post(
+    "/{user_id}/batch",
+    response_model=SessionBatchResponse,
+    status_code=201,
+    responses={400: {"model": ErrorResponse}},
+)
+async def create_sessions(
+    user_id: str,
+    batch_data: SessionBatchCreate,
+    background_tasks: BackgroundTasks,
+    session_service: SessionService = Depends(get_session_service),
+    user_service: UserService = Depends(get_user_service),
+):
+    """
+    Add several therapy session summaries to the knowledge graph at once.
+    
+    Sessions are ingested together, so entities are extracted and
+    deduplicated across the whole batch.
+    """
+    logger.info("Adding %d sessions for user: %s", len(batch_data.sessions), user_id)
+    try:
+        user_node = await user_service.get_or_create_user_node(user_id)
+        
+        added = await session_service.add_sessions(
+            sessions=[session.model_dump() for session in batch_data.sessions],
+            user_id=user_id,
+            user_name=user_node.name,
+        )
+        invalidate_user_profile(user_id)
+        
+        background_tasks.add_task(
+            user_service.link_user_sessions,
+            user_node=user_node,
+            user_id=user_id,
+        )
+        
+        logger.info("Sessions added successfully: User %s, %d sessions", user_id, len(added))
+        
+        return SessionBatchResponse.model_construct(
+            sessions=[
+                SessionResponse.model_construct(
+                    session_id=f"{user_id}_session_{session_number}",
+                    session_number=session_number,
+                    session_date=session.session_date,
+                    episode_uuid=episode_uuid,
+                    message=f"Session {session_number} added successfully",
+                )
+                for (episode_uuid, session_number), session in zip(added, batch_data.sessions)
+            ],
+            message=f"{len(added)} sessions added successfully",
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to add sessions for user %s: %s", user_id, e, exc_info=True)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to add sessions: {str(e)}"
+        )
@@ -2,7 +2,9 @@
 User management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from graphiti_core import Graphiti
 from graphiti_core.helpers import parse_db_date
 
@@ -10,6 +12,8 @@ from models.schemas import UserCreate, UserResponse, ErrorResponse, DeleteUserRe
 from services.user_service import UserService
 from utils.database import get_graphiti
 from utils.neo4j_driver import get_neo4j_driver, Neo4jDriver
+from utils.profile_cache import invalidate_user_profile
+from utils.queries import find_user_by_group
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +27,21 @@ async def get_user_service(
     return UserService(graphiti)
 
 
+def _user_etag(uuid: str, name: str, created_at: datetime, summary: str | None) -> str:
+    """Strong ETag for a user representation"""
+    fingerprint = f"{uuid}|{name}|{created_at.timestamp()}|{summary or ''}"
+    return f'"{hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 @router.post(
     "",
     response_model=UserResponse,
@@ -39,14 +58,14 @@ async def create_user(
     This endpoint creates a User node that serves as the parent for all
     therapy sessions and extracted entities.
     """
-    logger.info(f"Creating/retrieving user: {user_data.user_id} ({user_data.user_name})")
+    logger.info("Creating/retrieving user: %s (%s)", user_data.user_id, user_data.user_name)
     try:
         user_node = await user_service.create_or_get_user(
             user_name=user_data.user_name,
             user_id=user_data.user_id,
         )
         
-        logger.info(f"User created/retrieved successfully: {user_data.user_id} (UUID: {user_node.uuid})")
+        logger.info("User created/retrieved successfully: %s (UUID: %s)", user_data.user_id, user_node.uuid)
         
         return UserResponse(
             user_id=user_data.user_id,
@@ -58,7 +77,7 @@ async def create_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create user {user_data.user_id}: {e}", exc_info=True)
+        logger.error("Failed to create user %s: %s", user_data.user_id, e, exc_info=True)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to create user: {str(e)}"
@@ -72,45 +91,44 @@ async def create_user(
 )
 async def get_user(
     user_id: str,
+    request: Request,
+    response: Response,
     user_service: UserService = Depends(get_user_service),
     graphiti: Graphiti = Depends(get_graphiti),
 ):
     """
     Get user information by user_id.
+    
+    Responses carry an ETag; send it back as If-None-Match to get a
+    304 Not Modified when the user has not changed.
     """
-    logger.info(f"Retrieving user: {user_id}")
+    logger.info("Retrieving user: %s", user_id)
+    if_none_match = request.headers.get("if-none-match")
+    
     try:
-        # Try to find existing user node
-        # In Neo4j, labels are node labels, not properties - use labels() function
-        find_user_query = """
-            MATCH (user:Entity {group_id: $group_id})
-            WHERE 'User' IN labels(user)
-            RETURN user.uuid AS uuid, user.name AS name, labels(user) AS labels,
-                   user.created_at AS created_at, user.summary AS summary
-            LIMIT 1
-        """
-        
-        records, _, _ = await graphiti.driver.execute_query(
-            find_user_query,
-            group_id=user_id,
-        )
+        record = await find_user_by_group(graphiti.driver, user_id)
         
-        if not records:
-            logger.warning(f"User not found: {user_id}")
+        if record is None:
+            logger.info("User not found: %s", user_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"User with ID {user_id} not found"
             )
         
-        record = records[0]
-        logger.info(f"User retrieved successfully: {user_id}")
+        logger.info("User retrieved successfully: %s", user_id)
         
         # Convert Neo4j DateTime to Python datetime using Graphiti's helper
         created_at = parse_db_date(record.get('created_at'))
+        user_name = record.get('name', 'Unknown')
+        
+        etag = _user_etag(record.get('uuid'), user_name, created_at, record.get('summary'))
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         
         return UserResponse(
             user_id=user_id,
-            user_name=record.get('name', 'Unknown'),
+            user_name=user_name,
             uuid=record.get('uuid'),
             created_at=created_at,
             summary=record.get('summary'),
@@ -118,7 +136,7 @@ async def get_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving user {user_id}: {e}", exc_info=True)
+        logger.error("Error retrieving user %s: %s", user_id, e, exc_info=True)
         raise HTTPException(
             status_code=404,
             detail=f"User not found: {str(e)}"
@@ -147,23 +165,24 @@ async def delete_user(
     
     **Warning**: This operation is irreversible!
     """
-    logger.warning(f"DELETE request for user: {user_id} - This will permanently delete all user data")
+    logger.warning("DELETE request for user: %s - This will permanently delete all user data", user_id)
     try:
         result = await user_service.delete_user(
             user_id=user_id,
             neo4j_driver=neo4j_driver,
         )
+        invalidate_user_profile(user_id)
         
         if result["status"] == "no_data_found":
-            logger.warning(f"No data found to delete for user: {user_id}")
+            logger.warning("No data found to delete for user: %s", user_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"No data found for user {user_id}"
             )
         
         logger.info(
-            f"User data deleted successfully: {user_id} - "
-            f"Nodes: {result['deleted_nodes']}, Relationships: {result['deleted_relationships']}"
+            "User data deleted successfully: %s - Nodes: %s, Relationships: %s",
+            user_id, result['deleted_nodes'], result['deleted_relationships'],
         )
         
         return DeleteUserResponse(
@@ -176,7 +195,7 @@ async def delete_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete user data for {user_id}: {e}", exc_info=True)
+        logger.error("Failed to delete user data for %s: %s", user_id, e, exc_info=True)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to delete user data: {str(e)}"
@@ -2,40 +2,71 @@
 Configuration settings for the application
 """
 
-import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
 from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Export .env into os.environ too: pydantic-settings only reads declared
+# fields from it, but libraries (e.g. OPENAI_BASE_URL, Graphiti's
+# SEMAPHORE_LIMIT) read their settings straight from the environment
 load_dotenv()
 
 
 class Settings(BaseSettings):
-    """Application settings"""
+    """
+    Application settings.
+    
+    Each field is read once from the environment (by upper-cased name),
+    falling back to the .env file and then the default; environment
+    variables take precedence over .env.
+    """
+    
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
     
     # Neo4j Configuration
-    neo4j_url: str = os.getenv("NEO4J_URL", "bolt://localhost:7687")
-    neo4j_username: str = os.getenv("NEO4J_USERNAME", "neo4j")
-    neo4j_password: str = os.getenv("NEO4J_PASSWORD", "password")
+    neo4j_url: str = "bolt://localhost:7687"
+    neo4j_username: str = "neo4j"
+    neo4j_password: str = "password"
+    neo4j_max_pool_size: int = 50
+    neo4j_acquire_timeout_s: float = 30.0
+    neo4j_connection_timeout_s: float = 15.0
+    neo4j_max_connection_lifetime_s: float = 3600.0
+    neo4j_keep_alive: bool = True
     
     # OpenAI Configuration
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4")
-    openai_embedding_model: str = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4"
+    openai_embedding_model: str = "text-embedding-3-small"
+    openai_max_connections: int = 256
+    openai_max_keepalive_connections: int = 64
+    openai_timeout_s: float = 60.0
     
     # Application Configuration
     app_name: str = "MemoriGraph"
     app_version: str = "1.0.0"
-    debug: bool = os.getenv("DEBUG", "False").lower() == "true"
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    debug: bool = False
+    log_level: str = "INFO"
+    # The user and profile caches are per process, so keep one worker unless
+    # stale reads across workers are acceptable (see DEPLOYMENT.md)
+    web_concurrency: int = 1
+    
+    # CORS Configuration (comma-separated list of allowed origins)
+    cors_origins: str = "http://localhost:3000"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    @property
+    def cors_origin_list(self) -> list[str]:
+        """Allowed CORS origins parsed from the comma-separated setting"""
+        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (usable as a FastAPI dependency)"""
+    return Settings()
+
+
+settings = get_settings()
 
 # Validate required settings
 if not settings.openai_api_key:
     raise ValueError("OPENAI_API_KEY must be set in environment variables")
-
@@ -2,6 +2,7 @@
 FastAPI application main file
 """
 
+import time
 from contextlib import asynccontextmanager
 from fastapi import APIRouter, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,7 +13,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.config import settings
 from utils.database import graphiti_manager
 from utils.neo4j_driver import neo4j_driver
-from utils.logger import setup_logging, get_logger
+from utils.logger import setup_logging, stop_logging, get_logger
 from api.v1.routes import users, sessions, profile
 
 # Setup logging first
@@ -27,21 +28,27 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("=" * 60)
         logger.info("Starting application...")
-        logger.info(f"Environment: {'DEBUG' if settings.debug else 'PRODUCTION'}")
-        logger.info(f"Log Level: {settings.log_level.upper()}")
+        logger.info("Environment: %s", 'DEBUG' if settings.debug else 'PRODUCTION')
+        logger.info("Log Level: %s", settings.log_level.upper())
         
         logger.info("Initializing Graphiti...")
         await graphiti_manager.initialize()
-        logger.info("✓ Graphiti initialized successfully")
+        logger.info("✓ Graphiti initialized successfully (graph indexes ready)")
         
+        # Direct queries reuse Graphiti's driver, so this opens no new pool
         logger.info("Initializing Neo4j driver...")
-        await neo4j_driver.get_driver()
+        driver = await neo4j_driver.get_driver()
         logger.info("✓ Neo4j driver initialized successfully")
         
+        # Fail fast if Neo4j is unreachable instead of on the first request
+        logger.info("Verifying Neo4j connectivity...")
+        await driver.verify_connectivity()
+        logger.info("✓ Neo4j connectivity verified")
+        
         logger.info("Application startup complete")
         logger.info("=" * 60)
     except Exception as e:
-        logger.critical(f"Failed to start application: {e}", exc_info=True)
+        logger.critical("Failed to start application: %s", e, exc_info=True)
         raise
     
     yield
@@ -57,7 +64,7 @@ async def lifespan(app: FastAPI):
             await graphiti_manager.close()
             logger.info("✓ Graphiti connection closed")
         except Exception as e:
-            logger.warning(f"Error closing Graphiti: {e}")
+            logger.warning("Error closing Graphiti: %s", e)
         
         # Close Neo4j driver
         logger.info("Closing Neo4j driver...")
@@ -65,12 +72,14 @@ async def lifespan(app: FastAPI):
             await neo4j_driver.close()
             logger.info("✓ Neo4j driver closed")
         except Exception as e:
-            logger.warning(f"Error closing Neo4j driver: {e}")
+            logger.warning("Error closing Neo4j driver: %s", e)
         
         logger.info("Application shutdown complete")
         logger.info("=" * 60)
     except Exception as e:
-        logger.error(f"Error during shutdown: {e}", exc_info=True)
+        logger.error("Error during shutdown: %s", e, exc_info=True)
+    finally:
+        stop_logging()
 
 
 # Create FastAPI app
@@ -101,10 +110,12 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.cors_origin_list,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
+    max_age=600,  # Let browsers cache preflight responses for 10 minutes
 )
 
 # Include API version routers
@@ -120,8 +131,10 @@ app.include_router(api_v1)
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions"""
-    logger.warning(
-        f"HTTP {exc.status_code}: {exc.detail} - Path: {request.url.path}",
+    # Client errors (404s, bad input) are expected traffic, not warnings
+    log = logger.info if exc.status_code < 500 else logger.warning
+    log(
+        "HTTP %s: %s - Path: %s", exc.status_code, exc.detail, request.url.path,
         extra={"status_code": exc.status_code, "path": request.url.path}
     )
     return JSONResponse(
@@ -133,8 +146,8 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors"""
-    logger.warning(
-        f"Validation error: {exc.errors()} - Path: {request.url.path}",
+    logger.info(
+        "Validation error: %s - Path: %s", exc.errors(), request.url.path,
         extra={"errors": exc.errors(), "path": request.url.path}
     )
     return JSONResponse(
@@ -147,7 +160,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions"""
     logger.error(
-        f"Unhandled exception: {str(exc)} - Path: {request.url.path}",
+        "Unhandled exception: %s - Path: %s", exc, request.url.path,
         exc_info=True,
         extra={"path": request.url.path, "method": request.method}
     )
@@ -160,35 +173,46 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Successful responses faster than this are not logged
+SLOW_REQUEST_SECONDS = 0.5
+
+# Probe and docs traffic passes through without timing or logging
+SKIP_LOG_PATHS = frozenset({"/health", "/ready", "/", "/docs", "/openapi.json", "/redoc"})
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Middleware to log all requests"""
-    import time
+    """Middleware to log requests, plus failed or slow responses"""
+    if request.url.path in SKIP_LOG_PATHS:
+        return await call_next(request)
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Log request
     logger.info(
-        f"Request: {request.method} {request.url.path} - Client: {request.client.host if request.client else 'unknown'}"
+        "Request: %s %s - Client: %s",
+        request.method, request.url.path,
+        request.client.host if request.client else 'unknown',
     )
     
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         
-        # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} - "
-            f"Status: {response.status_code} - Time: {process_time:.3f}s"
-        )
+        # Log response only when it failed or was slow
+        if response.status_code >= 400 or process_time > SLOW_REQUEST_SECONDS:
+            logger.info(
+                "Response: %s %s - Status: %s - Time: %.3fs",
+                request.method, request.url.path, response.status_code, process_time,
+            )
         
         response.headers["X-Process-Time"] = str(process_time)
         return response
     except Exception as e:
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         logger.error(
-            f"Request failed: {request.method} {request.url.path} - "
-            f"Error: {str(e)} - Time: {process_time:.3f}s",
+            "Request failed: %s %s - Error: %s - Time: %.3fs",
+            request.method, request.url.path, e, process_time,
             exc_info=True
         )
         raise
@@ -208,24 +232,39 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    logger.debug("Health check endpoint accessed")
-    try:
-        # Check if connections are alive
-        graphiti = await graphiti_manager.get_graphiti()
-        neo4j = await neo4j_driver.get_driver()
-        
+    """Liveness probe - no I/O, always cheap"""
+    return {"status": "ok"}
+
+
+# Cached result of the last readiness probe
+READY_CACHE_SECONDS = 5.0
+_ready_state = {"ts": 0.0, "ok": False, "error": None}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe - verifies graph storage connectivity at most every few seconds"""
+    now = time.monotonic()
+    if now - _ready_state["ts"] >= READY_CACHE_SECONDS:
+        try:
+            driver = await neo4j_driver.get_driver()
+            await driver.verify_connectivity()
+            _ready_state.update(ok=True, error=None)
+        except Exception as e:
+            logger.error("Readiness check failed: %s", e, exc_info=True)
+            _ready_state.update(ok=False, error=str(e))
+        _ready_state["ts"] = now
+    
+    if _ready_state["ok"]:
         return {
-            "status": "healthy",
+            "status": "ready",
             "graph-engine": "connected",
             "graph-storage": "connected"
         }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={"status": "unhealthy", "error": str(e)}
-        )
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "unavailable", "error": _ready_state["error"]}
+    )
 
 
 if __name__ == "__main__":
@@ -234,6 +273,11 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        workers=settings.web_concurrency,
+        loop="uvloop",
+        http="httptools",
+        log_config=None,  # Logging is configured by utils.logger
+        access_log=False,  # log_requests middleware already logs requests
         reload=settings.debug,
     )
 
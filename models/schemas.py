@@ -2,19 +2,32 @@
 Pydantic schemas for API requests and responses
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Request bodies reject unknown fields; responses are built from trusted data
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", populate_by_name=True)
+RESPONSE_MODEL_CONFIG = ConfigDict(populate_by_name=True)
+
+# Bulk ingest extracts and dedupes entities across the whole batch in one
+# pass, so batches are kept small enough for that to stay tractable
+MAX_SESSION_BATCH_SIZE = 20
 
 
 class UserCreate(BaseModel):
     """Schema for creating a new user"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     user_name: str = Field(..., description="Name of the user")
     user_id: str = Field(..., description="Unique identifier for the user")
 
 
 class UserResponse(BaseModel):
     """Schema for user response"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     user_id: str
     user_name: str
     uuid: str
@@ -24,13 +37,17 @@ class UserResponse(BaseModel):
 
 class SessionCreate(BaseModel):
     """Schema for creating a therapy session"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     session_summary: str = Field(..., description="Text summary of the therapy session")
-    session_date: datetime = Field(default_factory=lambda: datetime.utcnow(), description="Date/time of the session")
+    session_date: datetime = Field(default_factory=partial(datetime.now, timezone.utc), description="Date/time of the session")
     session_number: Optional[int] = Field(None, description="Sequential session number (auto-generated if not provided)")
 
 
 class SessionResponse(BaseModel):
     """Schema for session response"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     session_id: str
     session_number: int
     session_date: datetime
@@ -38,14 +55,38 @@ class SessionResponse(BaseModel):
     message: str
 
 
+class SessionBatchCreate(BaseModel):
+    """Schema for adding several therapy sessions at once"""
+    model_config = REQUEST_MODEL_CONFIG
+    
+    sessions: List[SessionCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_SESSION_BATCH_SIZE,
+        description="Sessions to add, in order",
+    )
+
+
+class SessionBatchResponse(BaseModel):
+    """Schema for batch session response"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    sessions: List[SessionResponse]
+    message: str
+
+
 class ProfileQuery(BaseModel):
     """Schema for profile query request"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     query: str = Field(..., description="Natural language query about the user")
     user_id: str = Field(..., description="User ID to query")
 
 
 class ProfileResult(BaseModel):
     """Schema for a single profile search result"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     uuid: str
     fact: str
     valid_at: Optional[datetime] = None
@@ -54,6 +95,8 @@ class ProfileResult(BaseModel):
 
 class ProfileQueryResponse(BaseModel):
     """Schema for profile query response"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     query: str
     results: List[ProfileResult]
     count: int
@@ -61,6 +104,8 @@ class ProfileQueryResponse(BaseModel):
 
 class CenterNodeQuery(BaseModel):
     """Schema for center node query request"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     query: str = Field(..., description="Search query")
     center_node_uuid: str = Field(..., description="UUID of the center node for reranking")
     user_id: str = Field(..., description="User ID")
@@ -68,12 +113,16 @@ class CenterNodeQuery(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Schema for error responses"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     error: str
     detail: Optional[str] = None
 
 
 class DeleteUserResponse(BaseModel):
     """Schema for user deletion response"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     user_id: str
     deleted_nodes: int
     deleted_relationships: int
@@ -10,7 +10,11 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        workers=settings.web_concurrency,
+        loop="uvloop",
+        http="httptools",
+        log_config=None,  # Logging is configured by utils.logger
+        access_log=False,  # log_requests middleware already logs requests
         reload=settings.debug,
-        log_level="info",
     )
 
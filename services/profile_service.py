@@ -20,36 +20,37 @@ class ProfileService:
     async def search_profile(
         self,
         query: str,
+        user_id: str,
         center_node_uuid: str | None = None,
     ) -> List[ProfileResult]:
         """
         Search the user profile.
         
+        Graphiti's hybrid search embeds the query once, runs the vector and
+        BM25 branches concurrently and fuses them with reciprocal rank fusion;
+        scoping it to the user's group keeps both branches to their subgraph.
+        
         Args:
             query: Natural language query
+            user_id: The user's ID (searched as group_id)
             center_node_uuid: Optional center node UUID for reranking
         
         Returns:
             List of ProfileResult objects
         """
-        if center_node_uuid:
-            results = await self.graphiti.search(
-                query,
-                center_node_uuid=center_node_uuid,
-            )
-        else:
-            results = await self.graphiti.search(query)
+        results = await self.graphiti.search(
+            query,
+            center_node_uuid=center_node_uuid,
+            group_ids=[user_id],
+        )
         
-        profile_results = []
-        for result in results:
-            profile_results.append(
-                ProfileResult(
-                    uuid=result.uuid,
-                    fact=result.fact,
-                    valid_at=getattr(result, 'valid_at', None),
-                    invalid_at=getattr(result, 'invalid_at', None),
-                )
+        # Results come straight from Graphiti, so skip re-validation
+        return [
+            ProfileResult.model_construct(
+                uuid=result.uuid,
+                fact=result.fact,
+                valid_at=getattr(result, 'valid_at', None),
+                invalid_at=getattr(result, 'invalid_at', None),
             )
-        
-        return profile_results
-
+            for result in results
+        ]
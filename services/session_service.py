@@ -3,13 +3,27 @@ Session service for managing therapy sessions
 """
 
 from datetime import datetime
+from typing import Any, Dict, Final, List
 from graphiti_core import Graphiti
+from neo4j import RoutingControl
 
-from utils.graph_operations import add_session_to_graph
+from utils.graph_operations import add_session_to_graph, add_sessions_to_graph
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Index-backed lookup on (group_id, session_number); sessions stored
+# before session_number was persisted fall back to a count
+_LAST_SESSION_NUMBER_CYPHER: Final[str] = """
+    MATCH (session:Episodic {group_id: $user_id})
+    RETURN max(session.session_number) AS last_session_number
+"""
+
+_SESSION_COUNT_CYPHER: Final[str] = """
+    MATCH (session:Episodic {group_id: $user_id})
+    RETURN count(session) AS session_count
+"""
+
 
 class SessionService:
     """Service for session-related operations"""
@@ -53,6 +67,50 @@ class SessionService:
         
         return episode_uuid, session_number
     
+    async def add_sessions(
+        self,
+        sessions: List[Dict[str, Any]],
+        user_id: str,
+        user_name: str,
+    ) -> List[tuple[str, int]]:
+        """
+        Add several therapy sessions to the knowledge graph in one batch.
+        
+        Args:
+            sessions: Sessions with session_summary, session_date and
+                optional session_number keys
+            user_id: Unique identifier for the user
+            user_name: Name of the user
+        
+        Returns:
+            list: (episode_uuid, session_number) per session, in input order
+        """
+        sessions = [dict(session) for session in sessions]
+        
+        # Number sessions without one after both the stored sessions and
+        # any numbers given explicitly in this batch
+        if any(session.get('session_number') is None for session in sessions):
+            next_number = await self._get_next_session_number(user_id)
+            explicit = [s['session_number'] for s in sessions if s.get('session_number') is not None]
+            if explicit:
+                next_number = max(next_number, max(explicit) + 1)
+            for session in sessions:
+                if session.get('session_number') is None:
+                    session['session_number'] = next_number
+                    next_number += 1
+        
+        episode_uuids = await add_sessions_to_graph(
+            self.graphiti,
+            sessions=sessions,
+            user_id=user_id,
+            user_name=user_name,
+        )
+        
+        return [
+            (episode_uuid, session['session_number'])
+            for episode_uuid, session in zip(episode_uuids, sessions)
+        ]
+    
     async def _get_next_session_number(self, user_id: str) -> int:
         """
         Get the next session number for a user.
@@ -64,14 +122,20 @@ class SessionService:
             int: Next session number
         """
         try:
-            query = """
-                MATCH (session:Episodic {group_id: $user_id})
-                RETURN count(session) as session_count
-            """
+            records, _, _ = await self.graphiti.driver.execute_query(
+                _LAST_SESSION_NUMBER_CYPHER,
+                user_id=user_id,
+                routing_=RoutingControl.READ,
+            )
+            
+            last_session_number = records[0].get('last_session_number') if records else None
+            if last_session_number is not None:
+                return int(last_session_number) + 1
             
             records, _, _ = await self.graphiti.driver.execute_query(
-                query,
+                _SESSION_COUNT_CYPHER,
                 user_id=user_id,
+                routing_=RoutingControl.READ,
             )
             
             if records:
@@ -79,6 +143,6 @@ class SessionService:
                 return int(count) + 1
             return 1
         except Exception as e:
-            logger.warning(f"Could not get session count: {e}")
+            logger.warning("Could not get session count: %s", e)
             return 1
 
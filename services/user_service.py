@@ -8,10 +8,12 @@ from graphiti_core.nodes import EntityNode
 
 from utils.graph_operations import (
     create_or_get_user_node,
+    load_user_entity,
     link_sessions_to_user,
     delete_user_data,
 )
 from utils.logger import get_logger
+from utils.user_cache import get_cached_user_node, invalidate_user_node
 
 logger = get_logger(__name__)
 
@@ -30,6 +32,9 @@ class UserService:
         """
         Create or retrieve a user node.
         
+        Repeat calls for the same user are served from the process-wide
+        user cache (a service instance only lives for one request).
+        
         Args:
             user_name: Name of the user
             user_id: Unique identifier for the user
@@ -37,9 +42,38 @@ class UserService:
         Returns:
             EntityNode: The user entity node
         """
+        return await get_cached_user_node(
+            user_id,
+            lambda: create_or_get_user_node(
+                self.graphiti,
+                user_name=user_name,
+                user_id=user_id,
+            ),
+            user_name=user_name,
+        )
+    
+    async def get_or_create_user_node(self, user_id: str) -> EntityNode:
+        """
+        Resolve the User node for a user_id, creating one with a default name if missing.
+        
+        Args:
+            user_id: Unique identifier for the user
+        
+        Returns:
+            EntityNode: The user entity node
+        """
+        return await get_cached_user_node(user_id, lambda: self._load_or_create_user(user_id))
+    
+    async def _load_or_create_user(self, user_id: str) -> EntityNode:
+        """Load the stored User node, or create one named after the user_id"""
+        user_node = await load_user_entity(self.graphiti, user_id)
+        if user_node is not None:
+            return user_node
+        
+        logger.debug("No User node stored for %s, creating one", user_id)
         return await create_or_get_user_node(
             self.graphiti,
-            user_name=user_name,
+            user_name=f"User_{user_id}",
             user_id=user_id,
         )
     
@@ -79,8 +113,10 @@ class UserService:
         Returns:
             Dict with deletion statistics
         """
-        return await delete_user_data(
+        result = await delete_user_data(
             user_id=user_id,
             neo4j_driver=neo4j_driver,
         )
+        invalidate_user_node(user_id)
+        return result
 
@@ -2,30 +2,60 @@
 Database initialization and Graphiti setup
 """
 
+import httpx
+from neo4j import AsyncDriver, AsyncGraphDatabase
 from openai import AsyncOpenAI
 from graphiti_core import Graphiti
+from graphiti_core.driver.neo4j_driver import Neo4jDriver as GraphitiNeo4jDriver
 from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
 from graphiti_core.llm_client.openai_client import OpenAIClient
 from graphiti_core.llm_client.config import LLMConfig
 
 from app.config import settings
+from utils.graph_operations import ensure_indexes
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def create_async_driver() -> AsyncDriver:
+    """Create a Neo4j async driver with the connection pool configured from settings"""
+    return AsyncGraphDatabase.driver(
+        settings.neo4j_url,
+        auth=(settings.neo4j_username, settings.neo4j_password),
+        max_connection_pool_size=settings.neo4j_max_pool_size,
+        connection_acquisition_timeout=settings.neo4j_acquire_timeout_s,
+        connection_timeout=settings.neo4j_connection_timeout_s,
+        max_connection_lifetime=settings.neo4j_max_connection_lifetime_s,
+        keep_alive=settings.neo4j_keep_alive,
+    )
+
+
 class GraphitiManager:
     """Manages Graphiti instance and connections"""
     
     def __init__(self):
         self._graphiti: Graphiti | None = None
         self._openai_client: AsyncOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
     
     async def initialize(self) -> Graphiti:
         """Initialize and return Graphiti instance"""
         if self._graphiti is None:
-            # Initialize OpenAI client
-            self._openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            # Initialize OpenAI client on a pooled HTTP/2 client sized for concurrent
+            # embedding/LLM calls
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=settings.openai_max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(settings.openai_timeout_s),
+            )
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=self._http_client,
+            )
             
             # Create LLM and Embedder clients
             llm_client = OpenAIClient(
@@ -42,19 +72,34 @@ class GraphitiManager:
                 config=OpenAIEmbedderConfig(embedding_model=settings.openai_embedding_model)
             )
             
-            # Initialize Graphiti
-            self._graphiti = Graphiti(
+            # Graphiti's Neo4j driver takes no pool options, so swap in a tuned client
+            graph_driver = GraphitiNeo4jDriver(
                 settings.neo4j_url,
                 settings.neo4j_username,
                 settings.neo4j_password,
+            )
+            default_client = graph_driver.client
+            graph_driver.client = create_async_driver()
+            await default_client.close()
+            
+            # Initialize Graphiti
+            self._graphiti = Graphiti(
+                graph_driver=graph_driver,
                 llm_client=llm_client,
                 embedder=embedder_client,
             )
             
             logger.info("Graphiti initialized successfully")
+            
+            await ensure_indexes(self._graphiti)
         
         return self._graphiti
     
+    @property
+    def graphiti(self) -> Graphiti | None:
+        """The initialized Graphiti instance, or None before startup"""
+        return self._graphiti
+    
     async def get_graphiti(self) -> Graphiti:
         """Get or initialize Graphiti instance"""
         if self._graphiti is None:
@@ -62,11 +107,17 @@ class GraphitiManager:
         return self._graphiti
     
     async def close(self):
-        """Close Graphiti connection"""
+        """Close Graphiti connection and the OpenAI HTTP client"""
         if self._graphiti is not None:
             await self._graphiti.close()
             self._graphiti = None
             logger.info("Graphiti connection closed")
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._openai_client = None
+            logger.info("OpenAI HTTP client closed")
 
 
 # Global instance
@@ -74,6 +125,15 @@ graphiti_manager = GraphitiManager()
 
 
 async def get_graphiti() -> Graphiti:
-    """FastAPI dependency to get Graphiti instance"""
-    return await graphiti_manager.get_graphiti()
+    """
+    FastAPI dependency to get Graphiti instance.
+    
+    Always returns the process-wide instance initialized during startup -
+    never construct one per request. Kept async on purpose: FastAPI runs
+    sync dependencies in a threadpool, which costs more than this coroutine.
+    """
+    graphiti = graphiti_manager.graphiti
+    if graphiti is not None:
+        return graphiti
+    return await graphiti_manager.initialize()
 
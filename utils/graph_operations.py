@@ -3,14 +3,137 @@ Graph operations and database utilities
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict, Final, List
 from graphiti_core import Graphiti
+from graphiti_core.helpers import parse_db_date
 from graphiti_core.nodes import EntityNode, EpisodeType
+from graphiti_core.utils.bulk_utils import RawEpisode
+from neo4j import RoutingControl
 
 from utils.logger import get_logger
+from utils.queries import FIND_USER_BY_GROUP_OR_NAME, find_user_by_group
 
 logger = get_logger(__name__)
 
+# Schema statements applied once at startup (all idempotent). Graphiti's own
+# uuid/group_id indexes come from its driver, so only the indexes behind the
+# application's queries are declared here.
+INDEX_STATEMENTS: Final[tuple[str, ...]] = (
+    "CREATE INDEX episodic_group_session IF NOT EXISTS "
+    "FOR (s:Episodic) ON (s.group_id, s.session_number)",
+    "CREATE INDEX user_group IF NOT EXISTS FOR (n:User) ON (n.group_id)",
+    "CREATE INDEX entity_group_name IF NOT EXISTS FOR (n:Entity) ON (n.group_id, n.name)",
+    "CREATE INDEX has_session_group IF NOT EXISTS FOR ()-[r:HAS_SESSION]-() ON (r.group_id)",
+)
+
+# Commit links in batches so users with thousands of sessions don't build
+# one large transaction; CALL ... IN TRANSACTIONS needs an auto-commit query
+_LINK_SESSIONS_CYPHER: Final[str] = """
+    MATCH (user:Entity {uuid: $user_uuid})
+    MATCH (session:Episodic {group_id: $group_id})
+    CALL {
+        WITH user, session
+        MERGE (user)-[r:HAS_SESSION]->(session)
+        ON CREATE SET r.created_at = datetime(), r.group_id = $group_id
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+_SET_SESSION_NUMBER_CYPHER: Final[str] = """
+    MATCH (session:Episodic {uuid: $episode_uuid})
+    SET session.session_number = $session_number
+"""
+
+_SET_SESSION_NUMBERS_CYPHER: Final[str] = """
+    UNWIND $sessions AS row
+    MATCH (session:Episodic {uuid: row.uuid})
+    SET session.session_number = row.session_number
+"""
+
+# Deletion is committed in batches (CALL ... IN TRANSACTIONS) so large
+# users don't build one huge transaction; that requires an auto-commit
+# query, not execute_write. Deleted node and relationship counts come from
+# the result summary's counters, so the query returns nothing. Matching per
+# label lets each UNION branch seek its :Label(group_id) index instead of
+# scanning every node.
+_DELETE_USER_CYPHER: Final[str] = """
+    CALL {
+        MATCH (n:Entity {group_id: $user_id}) RETURN n
+        UNION
+        MATCH (n:Episodic {group_id: $user_id}) RETURN n
+        UNION
+        MATCH (n:Community {group_id: $user_id}) RETURN n
+        UNION
+        MATCH (n:Saga {group_id: $user_id}) RETURN n
+    }
+    CALL {
+        WITH n
+        DETACH DELETE n
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+async def ensure_indexes(graphiti: Graphiti) -> None:
+    """
+    Create the indexes used by the application's own queries.
+    
+    Graphiti's Neo4j driver schedules its own range and full-text indexes
+    (which its BM25 search relies on) when it is constructed, so they are
+    not built again here.
+    
+    Args:
+        graphiti: The Graphiti instance
+    """
+    for statement in INDEX_STATEMENTS:
+        await graphiti.driver.execute_query(statement)
+    
+    logger.info("Ensured %d application indexes", len(INDEX_STATEMENTS))
+
+
+def _entity_node_from_record(record) -> EntityNode:
+    """
+    Build an EntityNode from a record holding the node's fields.
+    
+    Args:
+        record: Record with uuid, name, group_id, labels, created_at,
+            summary and attributes (the node's properties) columns
+    
+    Returns:
+        EntityNode: The hydrated entity node
+    """
+    attributes = dict(record['attributes'] or {})
+    for key in ('uuid', 'name', 'group_id', 'name_embedding', 'summary', 'created_at', 'labels'):
+        attributes.pop(key, None)
+    
+    return EntityNode(
+        uuid=record['uuid'],
+        name=record['name'],
+        group_id=record['group_id'],
+        labels=record['labels'],
+        created_at=parse_db_date(record['created_at']),
+        summary=record['summary'] or '',
+        attributes=attributes,
+    )
+
+
+async def load_user_entity(
+    graphiti: Graphiti,
+    user_id: str,
+) -> EntityNode | None:
+    """
+    Load the User node for a user in a single round-trip.
+    
+    Args:
+        graphiti: The Graphiti instance
+        user_id: Unique identifier for the user (used as group_id)
+    
+    Returns:
+        EntityNode | None: The User entity node, or None if it does not exist
+    """
+    record = await find_user_by_group(graphiti.driver, user_id)
+    if record is None:
+        return None
+    return _entity_node_from_record(record)
+
 
 async def create_or_get_user_node(
     graphiti: Graphiti,
@@ -30,28 +153,22 @@ async def create_or_get_user_node(
     """
     group_id = user_id
     
-    # Try to find existing User node
+    # Try to find existing User node: by label, else an entity with the user's name
     try:
-        find_user_query = """
-            MATCH (user:Entity {group_id: $group_id})
-            WHERE 'User' IN labels(user) OR user.name = $user_name
-            RETURN user.uuid AS uuid, user.name AS name, labels(user) AS labels
-            LIMIT 1
-        """
-        
         records, _, _ = await graphiti.driver.execute_query(
-            find_user_query,
+            FIND_USER_BY_GROUP_OR_NAME,
             group_id=group_id,
             user_name=user_name,
+            routing_=RoutingControl.READ,
         )
         
         if records:
-            user_uuid = records[0]['uuid']
-            user_node = await EntityNode.get_by_uuid(graphiti.driver, user_uuid)
-            logger.info(f"Retrieved existing User node: {user_name} (UUID: {user_node.uuid})")
+            # The row already carries the whole node, so no get_by_uuid round-trip
+            user_node = _entity_node_from_record(min(records, key=lambda record: record['rank']))
+            logger.info("Retrieved existing User node: %s (UUID: %s)", user_name, user_node.uuid)
             return user_node
     except Exception as e:
-        logger.debug(f"Could not find existing user node: {e}")
+        logger.debug("Could not find existing user node: %s", e)
     
     # Create new User entity node
     user_node = EntityNode(
@@ -71,7 +188,7 @@ async def create_or_get_user_node(
     # Save the user node to the graph
     await user_node.save(graphiti.driver)
     
-    logger.info(f"Created new User node: {user_name} (UUID: {user_node.uuid})")
+    logger.info("Created new User node: %s (UUID: %s)", user_name, user_node.uuid)
     return user_node
 
 
@@ -91,31 +208,21 @@ async def link_sessions_to_user(
     Returns:
         int: Number of sessions linked
     """
-    link_query = """
-        MATCH (user:Entity {uuid: $user_uuid})
-        MATCH (session:Episodic {group_id: $group_id})
-        WHERE NOT (user)-[:HAS_SESSION]->(session)
-        CREATE (user)-[:HAS_SESSION {
-            created_at: datetime(),
-            group_id: $group_id
-        }]->(session)
-        RETURN count(session) as linked_sessions
-    """
-    
     try:
-        records, _, _ = await graphiti.driver.execute_query(
-            link_query,
-            user_uuid=user_node.uuid,
-            group_id=user_id,
-        )
+        async with graphiti.driver.session() as session:
+            result = await session.run(
+                _LINK_SESSIONS_CYPHER,
+                user_uuid=user_node.uuid,
+                group_id=user_id,
+            )
+            summary = await result.consume()
         
-        if records:
-            linked_count = records[0].get('linked_sessions', 0)
-            logger.info(f"Linked {linked_count} therapy sessions to User node")
-            return linked_count
-        return 0
+        # MERGE also matches existing links, so count only the ones it created
+        linked_count = summary.counters.relationships_created
+        logger.info("Linked %d therapy sessions to User node", linked_count)
+        return linked_count
     except Exception as e:
-        logger.warning(f"Could not create HAS_SESSION relationships: {e}")
+        logger.warning("Could not create HAS_SESSION relationships: %s", e)
         return 0
 
 
@@ -153,13 +260,113 @@ async def add_session_to_graph(
         group_id=user_id,
     )
     
-    logger.info(f"Added Session {session_number} to knowledge graph")
-    return result.episode.uuid if hasattr(result, 'episode') else "unknown"
+    if not hasattr(result, 'episode'):
+        logger.info("Added Session %s to knowledge graph", session_number)
+        return "unknown"
+    
+    # Persist the session number so the next one can be found via index lookup
+    await graphiti.driver.execute_query(
+        _SET_SESSION_NUMBER_CYPHER,
+        episode_uuid=result.episode.uuid,
+        session_number=session_number,
+    )
+    
+    logger.info("Added Session %s to knowledge graph", session_number)
+    return result.episode.uuid
+
+
+async def add_sessions_to_graph(
+    graphiti: Graphiti,
+    sessions: List[Dict[str, Any]],
+    user_id: str,
+    user_name: str,
+) -> List[str]:
+    """
+    Add several therapy session summaries to the knowledge graph in one bulk ingest.
+    
+    Graphiti's bulk ingest extracts and dedupes entities across the whole
+    batch instead of running the full pipeline once per session.
+    
+    Args:
+        graphiti: The Graphiti instance
+        sessions: Sessions with session_summary, session_date and session_number keys
+        user_id: Unique identifier for the user
+        user_name: Name of the user
+    
+    Returns:
+        List[str]: Episode UUIDs, in the order the sessions were given
+    """
+    # RawEpisode.uuid refers to an already-stored episode, so new sessions
+    # leave it unset and take their UUIDs from the (input-ordered) results
+    result = await graphiti.add_episode_bulk(
+        [
+            RawEpisode(
+                name=f'Therapy Session {session["session_number"]}',
+                content=f'Session {session["session_number"]} for {user_name}: {session["session_summary"]}',
+                source=EpisodeType.text,
+                source_description='therapy session summary',
+                reference_time=session['session_date'],
+            )
+            for session in sessions
+        ],
+        group_id=user_id,
+    )
+    episode_uuids = [episode.uuid for episode in result.episodes]
+    
+    await graphiti.driver.execute_query(
+        _SET_SESSION_NUMBERS_CYPHER,
+        sessions=[
+            {'uuid': episode_uuid, 'session_number': session['session_number']}
+            for episode_uuid, session in zip(episode_uuids, sessions)
+        ],
+    )
+    
+    logger.info("Added %d sessions to knowledge graph for %s", len(sessions), user_id)
+    return episode_uuids
+
+
+async def _delete_user_data(session, user_id: str) -> Dict[str, Any]:
+    """
+    Delete a user's data on an already-open Neo4j session.
+    
+    Args:
+        session: Open Neo4j async session
+        user_id: The user's group_id
+    
+    Returns:
+        Dict with deletion statistics
+    """
+    result = await session.run(_DELETE_USER_CYPHER, user_id=user_id)
+    summary = await result.consume()
+    
+    deleted_nodes = summary.counters.nodes_deleted
+    rel_count = summary.counters.relationships_deleted
+    
+    if deleted_nodes == 0:
+        return {
+            "user_id": user_id,
+            "deleted_nodes": 0,
+            "deleted_relationships": 0,
+            "status": "no_data_found"
+        }
+    
+    logger.info(
+        "Deleted user data for %s: %s nodes, %s relationships",
+        user_id, deleted_nodes, rel_count,
+    )
+    
+    return {
+        "user_id": user_id,
+        "deleted_nodes": deleted_nodes,
+        "deleted_relationships": rel_count,
+        "status": "success"
+    }
 
 
 async def delete_user_data(
     user_id: str,
     neo4j_driver,
+    session=None,
 ) -> Dict[str, Any]:
     """
     Delete all data associated with a user from the Neo4j graph.
@@ -168,70 +375,26 @@ async def delete_user_data(
     - User Entity node
     - All Episodic nodes (therapy sessions) for the user
     - All Entity nodes belonging to the user (via group_id)
-    - All RelatesToNode_ nodes connected to user entities
+    - All Community nodes belonging to the user (via group_id)
+    - All Saga nodes belonging to the user (via group_id)
     - All relationships (HAS_SESSION, MENTIONS, RELATES_TO, etc.)
     
     Args:
         user_id: The user's group_id
         neo4j_driver: Neo4j driver instance
+        session: Optional open Neo4j session, so callers deleting several
+            users can reuse one session instead of opening one per user
     
     Returns:
         Dict with deletion statistics
     """
-    driver = await neo4j_driver.get_driver()
-    
-    # First, count nodes and relationships before deletion
-    count_query = """
-    MATCH (n)
-    WHERE n.group_id = $user_id
-    OPTIONAL MATCH (n)-[r]-()
-    RETURN count(DISTINCT n) as node_count, count(DISTINCT r) as rel_count
-    """
-    
-    # Query to delete all user data
-    # Using DETACH DELETE to automatically remove all relationships
-    delete_query = """
-    MATCH (n)
-    WHERE n.group_id = $user_id
-    DETACH DELETE n
-    RETURN count(n) as deleted_nodes
-    """
-    
     try:
+        if session is not None:
+            return await _delete_user_data(session, user_id)
+        
+        driver = await neo4j_driver.get_driver()
         async with driver.session() as session:
-            # Count before deletion
-            count_result = await session.run(count_query, user_id=user_id)
-            count_record = await count_result.single()
-            
-            node_count = count_record.get('node_count', 0) if count_record else 0
-            rel_count = count_record.get('rel_count', 0) if count_record else 0
-            
-            if node_count == 0:
-                return {
-                    "user_id": user_id,
-                    "deleted_nodes": 0,
-                    "deleted_relationships": 0,
-                    "status": "no_data_found"
-                }
-            
-            # Perform deletion
-            delete_result = await session.run(delete_query, user_id=user_id)
-            delete_record = await delete_result.single()
-            
-            deleted_nodes = delete_record.get('deleted_nodes', 0) if delete_record else 0
-            
-            logger.info(
-                f"Deleted user data for {user_id}: "
-                f"{deleted_nodes} nodes, {rel_count} relationships"
-            )
-            
-            return {
-                "user_id": user_id,
-                "deleted_nodes": deleted_nodes,
-                "deleted_relationships": rel_count,
-                "status": "success"
-            }
+            return await _delete_user_data(session, user_id)
     except Exception as e:
-        logger.error(f"Error deleting user data for {user_id}: {e}")
+        logger.error("Error deleting user data for %s: %s", user_id, e)
         raise
-
@@ -3,8 +3,9 @@ Logging configuration for the application
 """
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from app.config import settings
 
@@ -16,6 +17,30 @@ LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "app.log"
 ERROR_LOG_FILE = LOG_DIR / "error.log"
 
+# Log level resolved once from settings
+LOG_LEVEL = getattr(logging, settings.log_level.upper(), logging.INFO)
+
+# No formatter uses thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Formatters are shared across handlers and setup_logging() calls.
+# Source location is only kept for the error log.
+DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Background listener that performs the actual handler I/O
+_queue_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
 
 def setup_logging():
     """
@@ -26,33 +51,27 @@ def setup_logging():
     - File handler with rotation
     - Separate error log file
     - Proper formatting for production
-    """
-    # Get log level from settings
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    Records are queued by the root logger and written by a background
+    QueueListener thread, so request handlers never block on console or
+    file I/O.
+    """
+    global _queue_listener, _queue_handler
     
     # Root logger configuration
     root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
+    root_logger.setLevel(LOG_LEVEL)
     
-    # Remove existing handlers
+    # Remove existing handlers (and the listener from a previous call)
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     root_logger.handlers.clear()
     
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(LOG_LEVEL)
+    console_handler.setFormatter(SIMPLE_FORMATTER)
     
     # File handler with rotation (all logs)
     file_handler = RotatingFileHandler(
@@ -61,9 +80,8 @@ def setup_logging():
         backupCount=5,
         encoding='utf-8'
     )
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.setLevel(LOG_LEVEL)
+    file_handler.setFormatter(SIMPLE_FORMATTER)
     
     # Error file handler (errors and above only)
     error_handler = RotatingFileHandler(
@@ -73,8 +91,20 @@ def setup_logging():
         encoding='utf-8'
     )
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
+    error_handler.setFormatter(DETAILED_FORMATTER)
+    
+    # Route records through a queue; the listener thread feeds the handlers
+    log_queue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
     
     # Set log levels for third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -85,8 +115,30 @@ def setup_logging():
     
     # Log initialization
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured - Level: {settings.log_level.upper()}")
-    logger.info(f"Log files: {LOG_FILE}, {ERROR_LOG_FILE}")
+    logger.info("Logging configured - Level: %s", settings.log_level.upper())
+    logger.info("Log files: %s, %s", LOG_FILE, ERROR_LOG_FILE)
+
+
+def stop_logging():
+    """
+    Flush queued records and stop the background listener.
+    
+    The handlers are reattached to the root logger so records emitted
+    after shutdown are still written, just synchronously.
+    """
+    global _queue_listener, _queue_handler
+    
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    for handler in _queue_listener.handlers:
+        root_logger.addHandler(handler)
+    
+    _queue_listener = None
+    _queue_handler = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -2,39 +2,38 @@
 Neo4j driver utilities for direct database operations
 """
 
-from neo4j import AsyncGraphDatabase
-from app.config import settings
+from neo4j import AsyncDriver
+
+from utils.database import graphiti_manager
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class Neo4jDriver:
-    """Neo4j driver for direct database operations"""
+    """
+    Neo4j driver for direct database operations.
+    
+    Thin adapter over the driver owned by Graphiti, so direct queries share
+    Graphiti's connection pool instead of opening a second one.
+    """
     
     def __init__(self):
-        self._driver = None
+        self._driver: AsyncDriver | None = None
     
-    async def get_driver(self):
-        """Get or create Neo4j driver"""
+    async def get_driver(self) -> AsyncDriver:
+        """Get the Neo4j driver shared with Graphiti"""
         if self._driver is None:
-            self._driver = AsyncGraphDatabase.driver(
-                settings.neo4j_url,
-                auth=(settings.neo4j_username, settings.neo4j_password)
-            )
-            logger.info("Neo4j driver initialized")
+            graphiti = await graphiti_manager.get_graphiti()
+            self._driver = graphiti.driver.client
+            logger.info("Neo4j driver attached to Graphiti's connection pool")
         return self._driver
     
     async def close(self):
-        """Close Neo4j driver"""
+        """Release the shared Neo4j driver (Graphiti owns and closes it)"""
         if self._driver is not None:
-            try:
-                await self._driver.close()
-                logger.info("Neo4j driver closed")
-            except Exception as e:
-                logger.warning(f"Error closing Neo4j driver: {e}")
-            finally:
-                self._driver = None
+            self._driver = None
+            logger.info("Neo4j driver released")
 
 
 # Global instance
@@ -42,6 +41,10 @@ neo4j_driver = Neo4jDriver()
 
 
 async def get_neo4j_driver() -> Neo4jDriver:
-    """FastAPI dependency to get Neo4j driver"""
+    """
+    FastAPI dependency to get Neo4j driver.
+    
+    Always returns the process-wide instance, whose driver (and connection
+    pool) is created once during startup - never construct one per request.
+    """
     return neo4j_driver
-
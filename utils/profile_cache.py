@@ -0,0 +1,63 @@
+"""
+In-process cache for profile search results
+"""
+
+from itertools import count
+from typing import List
+from cachetools import TTLCache
+
+from models.schemas import ProfileResult
+
+# (user_id, version, normalized query, center_node_uuid) -> search results
+profile_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+# Replaced whenever a user's graph changes so older cache keys stop matching.
+# Versions come from one global counter and a user without an entry is given
+# a fresh one, so an expired or evicted version is never handed out again and
+# results cached under it (even by searches still in flight) are unreachable.
+# Entries outlive profile_cache's TTL so live results don't lose their version.
+_user_versions: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_version_counter = count(1)
+
+
+def profile_cache_key(
+    user_id: str,
+    query: str,
+    center_node_uuid: str | None = None,
+) -> tuple:
+    """
+    Build the cache key for a profile search.
+    
+    Args:
+        user_id: The user's ID
+        query: Natural language query
+        center_node_uuid: Optional center node UUID used for reranking
+    
+    Returns:
+        Hashable cache key scoped to the user's current graph version
+    """
+    version = _user_versions.get(user_id)
+    if version is None:
+        version = _user_versions[user_id] = next(_version_counter)
+    
+    return (
+        user_id,
+        version,
+        query.strip().lower(),
+        center_node_uuid,
+    )
+
+
+def get_cached_results(key: tuple) -> List[ProfileResult] | None:
+    """Return cached results for a key, or None on a miss"""
+    return profile_cache.get(key)
+
+
+def cache_results(key: tuple, results: List[ProfileResult]) -> None:
+    """Store search results under a key"""
+    profile_cache[key] = results
+
+
+def invalidate_user_profile(user_id: str) -> None:
+    """Invalidate every cached search for a user after their graph changes"""
+    _user_versions[user_id] = next(_version_counter)
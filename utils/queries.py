@@ -0,0 +1,53 @@
+"""
+Shared Cypher queries
+"""
+
+from typing import Final
+from neo4j import RoutingControl
+
+# Every field needed to hydrate the User EntityNode; name_embedding is blanked
+# out of the attributes map since no caller needs the vector
+_USER_FIELDS: Final[str] = (
+    "user.uuid AS uuid, user.name AS name, user.group_id AS group_id, "
+    "labels(user) AS labels, user.created_at AS created_at, "
+    "user.summary AS summary, user {.*, name_embedding: null} AS attributes"
+)
+
+# Matching on :User lets the planner seek the user_group index instead of
+# scanning every Entity in the group
+FIND_USER_BY_GROUP: Final[str] = f"""
+    MATCH (user:User {{group_id: $group_id}})
+    RETURN {_USER_FIELDS}
+    LIMIT 1
+"""
+
+# Try the User label first, then an entity carrying the user's name. Each UNION
+# branch is its own index seek; rank prefers the User-labelled match.
+FIND_USER_BY_GROUP_OR_NAME: Final[str] = f"""
+    MATCH (user:User {{group_id: $group_id}})
+    RETURN {_USER_FIELDS}, 0 AS rank
+    LIMIT 1
+    UNION ALL
+    MATCH (user:Entity {{group_id: $group_id, name: $user_name}})
+    RETURN {_USER_FIELDS}, 1 AS rank
+    LIMIT 1
+"""
+
+
+async def find_user_by_group(driver, user_id: str):
+    """
+    Find the User node record for a user.
+    
+    Args:
+        driver: Graph driver to query (e.g. graphiti.driver)
+        user_id: Unique identifier for the user (used as group_id)
+    
+    Returns:
+        The User record, or None if the user does not exist
+    """
+    records, _, _ = await driver.execute_query(
+        FIND_USER_BY_GROUP,
+        group_id=user_id,
+        routing_=RoutingControl.READ,
+    )
+    return records[0] if records else None
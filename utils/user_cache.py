@@ -0,0 +1,97 @@
+"""
+In-process cache for resolved User nodes
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+from cachetools import TTLCache
+from graphiti_core.nodes import EntityNode
+
+# user_id -> User EntityNode
+user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# (user_id, user_name) -> in-flight load, so concurrent misses for the same
+# request share one Neo4j lookup (and at most one User node write + embedding
+# call). A user_name of None means "any name".
+_inflight: dict[tuple[str, str | None], asyncio.Task] = {}
+
+# Serializes loads for the same user that differ in user_name, so each still
+# runs its own lookup but only the first can create the User node
+_user_locks: dict[str, asyncio.Lock] = {}
+
+# Loads that were in flight when their user was invalidated (task -> user_id).
+# They leave _inflight so later callers start a fresh load; their result is
+# returned to the callers already waiting but never cached.
+_stale_loads: dict[asyncio.Task, str] = {}
+
+
+async def get_cached_user_node(
+    user_id: str,
+    load: Callable[[], Awaitable[EntityNode]],
+    user_name: str | None = None,
+) -> EntityNode:
+    """
+    Return the cached User node for a user_id, loading it on a miss.
+    
+    Args:
+        user_id: Unique identifier for the user (used as group_id)
+        load: Coroutine factory that queries or creates the User node
+        user_name: Name the load looks up or creates the user under, if any;
+            only concurrent calls with the same name share a load
+    
+    Returns:
+        EntityNode: The User entity node
+    """
+    user_node = user_cache.get(user_id)
+    if user_node is not None:
+        return user_node
+    
+    key = (user_id, user_name)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_load_and_cache(key, load))
+        _inflight[key] = task
+    
+    # Shield so one caller disconnecting doesn't cancel the load for the others
+    return await asyncio.shield(task)
+
+
+async def _load_and_cache(
+    key: tuple[str, str | None],
+    load: Callable[[], Awaitable[EntityNode]],
+) -> EntityNode:
+    """Run a User node load and cache its result"""
+    user_id = key[0]
+    task = asyncio.current_task()
+    lock = _user_locks.setdefault(user_id, asyncio.Lock())
+    try:
+        async with lock:
+            user_node = await load()
+            if task not in _stale_loads:
+                user_cache[user_id] = user_node
+            return user_node
+    finally:
+        # An invalidation may already have replaced this load with a fresh one
+        if _inflight.get(key) is task:
+            del _inflight[key]
+        _stale_loads.pop(task, None)
+        # Every load holding or awaiting the lock is in _inflight or
+        # _stale_loads, so the lock is only dropped once none are left
+        lock_in_use = (
+            any(inflight_id == user_id for inflight_id, _ in _inflight)
+            or user_id in _stale_loads.values()
+        )
+        if not lock_in_use:
+            _user_locks.pop(user_id, None)
+
+
+def invalidate_user_node(user_id: str) -> None:
+    """
+    Drop a user's cached User node.
+    
+    Loads already in flight still answer the callers waiting on them, but
+    their result is not cached and later callers start a new load.
+    """
+    user_cache.pop(user_id, None)
+    for key in [key for key in _inflight if key[0] == user_id]:
+        _stale_loads[_inflight.pop(key)] = user_id